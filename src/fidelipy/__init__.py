@@ -18,13 +18,27 @@ Must be logged in before calling any driver function.
 __all__ = ["Quote", "Action", "Unit", "Driver"]
 
 
+import re
 from dataclasses import dataclass
-from decimal import ROUND_DOWN, Decimal
+from decimal import Decimal
 from enum import Enum, auto
+from io import BytesIO
 from logging import getLogger
 from pathlib import Path
-
-from playwright.sync_api import Browser
+from time import monotonic
+from types import SimpleNamespace
+from typing import Callable, Optional, Union
+from urllib.parse import urlparse
+
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    BrowserType,
+    Download,
+    Locator,
+    Page,
+    Route,
+)
 
 from . import _strings
 
@@ -57,6 +71,29 @@ class Quote:
     ask_size: int
     volume: int
 
+    # dataclass(slots=True) requires Python 3.10+.
+    __slots__ = (
+        "symbol",
+        "name",
+        "last_price",
+        "dollar_change",
+        "percent_change",
+        "bid",
+        "bid_size",
+        "ask",
+        "ask_size",
+        "volume",
+    )
+
+    # Frozen instances cannot be restored with setattr, which pickle and copy use for
+    # slots by default.
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class Action(Enum):
     """Action enum for orders.
@@ -82,30 +119,155 @@ class Unit(Enum):
     DOLLARS = auto()
 
 
+# Resources the driver never reads.  Aborted while navigating if block_resources is set.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Analytics domains.  Subdomains such as stats.g.doubleclick.net are blocked too.
+_BLOCKED_HOSTS = frozenset({"doubleclick.net", "google-analytics.com", "adobedtm.com"})
+
+
+# Read every quote field in one round trip.  Returns false until all fields are shown.
+_QUOTE_SCRIPT = """() => {
+    const text = (selector) => {
+        const element = document.querySelector(selector);
+        return element && element.innerText.trim();
+    };
+    const texts = (selector) =>
+        Array.from(document.querySelectorAll(selector), (e) => e.innerText.trim());
+    const quote = {
+        name: text(".company-title"),
+        lastPrice: text(".last-price"),
+        changes: texts(".eq-ticket__symbol__dollar_percent_chg_font"),
+        prices: texts(".block-price-layout"),
+        volume: text(".block-volume"),
+    };
+    return quote.name !== null && quote.lastPrice !== null && quote.volume !== null
+        && quote.changes.length >= 2 && quote.prices.length >= 2 && quote;
+}"""
+
+# Read the ticket's bid and ask in one round trip once both are shown.
+_BID_ASK_SCRIPT = """() => {
+    const numbers = Array.from(
+        document.querySelectorAll(".number"), (e) => e.innerText.trim()
+    );
+    return numbers.length >= 2 && numbers;
+}"""
+
+# Start a navigation without waiting for it.
+_NAVIGATE_SCRIPT = "url => { location.href = url; }"
+
+
+# Milliseconds to wait for the logout page.  The server has logged out by the time it
+# responds, so there is no reason to wait the full timeout on exit.
+_LOGOUT_TIMEOUT = 2000
+
+# Most pages quotes() keeps open at once.
+_MAX_QUOTE_PAGES = 8
+
+# Seconds a quote is reused for.  Kept short because stale prices are unsafe to trade.
+_QUOTE_TTL = 0.25
+
+
+def _blocked_host(url: str) -> bool:
+    labels = (urlparse(url).hostname or "").split(".")
+    return any(
+        ".".join(labels[i:]) in _BLOCKED_HOSTS for i in range(len(labels) - 1)
+    )
+
+
+def _route(route: Route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _blocked_host(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _goto(page: Page, url: str, wait_until: str, block_resources: bool) -> None:
+    if not block_resources:
+        page.goto(url, wait_until=wait_until)
+        return
+
+    # Routed requests only proceed while Python is inside a Playwright call, and
+    # routing disables the HTTP cache, so only route for the navigation itself.
+    page.route("**/*", _route)
+    try:
+        page.goto(url, wait_until=wait_until)
+    finally:
+        page.unroute("**/*", _route)
+
+
+def _not_blank(url: str) -> bool:
+    return url != "about:blank"
+
+
 def _validate_action(action: Action) -> None:
-    if action not in (Action.BUY, Action.SELL):
+    if not isinstance(action, Action):
         raise ValueError(_strings.ACTION)
 
 
 def _validate_unit(unit: Unit) -> None:
-    if unit not in (Unit.SHARES, Unit.DOLLARS):
+    if not isinstance(unit, Unit):
         raise ValueError(_strings.UNIT)
 
 
+def _validate_timeout(timeout: int) -> None:
+    if timeout <= 0:
+        raise ValueError(_strings.DRIVER_TIMEOUT)
+
+
+_CURRENCY_CHARS = frozenset("$,%()")
+_CURRENCY_TRANS = str.maketrans("", "", "$,%()")
+# Sign, whole dollars, and fraction.  At least one digit is required.
+_DOLLARS_PATTERN = re.compile(r"([+-]?)(?=\.?\d)(\d*)(?:\.(\d*))?")
+
+
 def _int(string: str) -> int:
     return int(string.replace(",", ""))
 
 
 def _decimal(string: str) -> Decimal:
-    return Decimal(string.translate(str.maketrans("", "", "$,%()")))
+    # Plain numbers like "1.23" skip building a translated copy.
+    if _CURRENCY_CHARS.isdisjoint(string):
+        return Decimal(string)
+    return Decimal(string.translate(_CURRENCY_TRANS))
 
 
 def _cents(dollars: str) -> int:
-    return int(_decimal(dollars).quantize(Decimal("0.01"), ROUND_DOWN) * 100)
+    # Integer parsing truncates toward zero like quantize(ROUND_DOWN) did.
+    match = _DOLLARS_PATTERN.fullmatch(dollars.translate(_CURRENCY_TRANS).strip())
+    if not match:
+        raise ValueError(f"invalid dollar amount: {dollars!r}")
+    sign, whole, fraction = match.groups()
+    cents = int(whole or "0") * 100 + int(((fraction or "") + "00")[:2])
+    return -cents if sign == "-" else cents
 
 
 def _dollars(cents: int) -> str:
-    return str(Decimal(cents).quantize(Decimal("0.01")) / 100)
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{cents:02d}"
+
+
+def _read_quote(page: Page) -> dict:
+    return page.wait_for_function(_QUOTE_SCRIPT).json_value()
+
+
+def _quote(symbol: str, fields: dict) -> Quote:
+    changes = fields["changes"]
+    bid, bid_size = fields["prices"][0].split("x")
+    ask, ask_size = fields["prices"][1].split("x")
+    return Quote(
+        symbol,
+        fields["name"],
+        _decimal(fields["lastPrice"]),
+        _decimal(changes[0]),
+        _decimal(changes[1]),
+        _decimal(bid),
+        _int(bid_size),
+        _decimal(ask),
+        _int(ask_size),
+        _int(fields["volume"]),
+    )
 
 
 def _confirm(prompt: str) -> bool:
@@ -113,6 +275,53 @@ def _confirm(prompt: str) -> bool:
     return not response or response.lower() == "y"
 
 
+class _ContextPool:
+    """Idle browser contexts kept open for reuse by later drivers on the same browser.
+
+    Creating a context is much cheaper than launching a browser, but reusing one is
+    cheaper still.  Cookies and permissions are cleared on release.  Other storage
+    such as localStorage and the HTTP cache is kept.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.__max_size = max_size
+        self.__idle: dict[Browser, list[BrowserContext]] = {}
+
+    def acquire(self, browser: Browser) -> BrowserContext:
+        idle = self.__idle.get(browser)
+        if idle:
+            return idle.pop()
+        return browser.new_context(no_viewport=True)
+
+    def release(self, browser: Browser, context: BrowserContext) -> None:
+        if not browser.is_connected():
+            return
+        if browser not in self.__idle:
+            self.__idle[browser] = []
+            browser.on("disconnected", self.__forget)
+        idle = self.__idle[browser]
+        if len(idle) < self.__max_size:
+            context.clear_cookies()
+            context.clear_permissions()
+            idle.append(context)
+        else:
+            context.close()
+
+    def close(self) -> None:
+        for browser, idle in self.__idle.items():
+            if browser.is_connected():
+                for context in idle:
+                    context.close()
+        self.__idle.clear()
+
+    def __forget(self, browser: Browser) -> None:
+        # The browser's contexts are gone with it.
+        self.__idle.pop(browser, None)
+
+
+_pool = _ContextPool()
+
+
 class Driver:
     """fidelity.com driver.
 
@@ -120,41 +329,219 @@ class Driver:
         browser: The Playwright Browser_ to use.
         timeout: The time in seconds to wait for web elements to appear.  Defaults to 10
             seconds.  Must be positive.
+        context: The Playwright BrowserContext_ to use.  Defaults to a context from a
+            pool shared by all drivers on the same browser.  Pooled contexts keep the
+            local storage of earlier drivers.  A context passed in is left open on
+            exit.
+        confirm: Called with a prompt before and after placing an order.  Returns True
+            to continue.  Defaults to asking on the command line.
+        wait_until: When a navigation is finished: ``"domcontentloaded"``, ``"load"``,
+            or ``"networkidle"``.  Defaults to ``"domcontentloaded"`` because every
+            action waits for its own element.
+        block_resources: Whether to abort image, font, media, and analytics requests
+            made while navigating.  Defaults to False.  Installing the route disables
+            the HTTP cache for the navigation, so this is not necessarily faster.
 
     .. _browser: https://playwright.dev/python/docs/api/class-browser
+    .. _browsercontext: https://playwright.dev/python/docs/api/class-browsercontext
     """
 
-    def __init__(self, browser: Browser, timeout: int = 10):
-        self.__browser = browser
-        self.__context = self.__browser.new_context(no_viewport=True)
-        self.__page = self.__context.new_page()
+    def __init__(
+        self,
+        browser: Browser,
+        timeout: int = 10,
+        *,
+        context: Optional[BrowserContext] = None,
+        confirm: Callable[[str], bool] = _confirm,
+        wait_until: str = "domcontentloaded",
+        block_resources: bool = False,
+    ):
+        _validate_timeout(timeout)
+
+        if context is None:
+            context, pool_browser = _pool.acquire(browser), browser
+        else:
+            pool_browser = None
+        self.__setup(
+            context,
+            pool_browser,
+            False,
+            timeout,
+            confirm,
+            wait_until,
+            block_resources,
+        )
+
+    def __setup(
+        self,
+        context: BrowserContext,
+        pool_browser: Optional[Browser],
+        persistent: bool,
+        timeout: int,
+        confirm: Callable[[str], bool],
+        wait_until: str,
+        block_resources: bool,
+        page: Optional[Page] = None,
+    ) -> None:
+        # The browser a pooled context is returned to on exit.
+        self.__pool_browser = pool_browser
+        self.__persistent = persistent
+        self.__confirm = confirm
+        self.__wait_until = wait_until
+        self.__block_resources = block_resources
+        self.__context = context
+        self.__timeout = timeout * 1000
+        if page is None:
+            self.__page = self.__new_page()
+        else:
+            self.__page = page
+            self.__page.set_default_timeout(self.__timeout)
         self.__logger = getLogger(__name__)
 
-        if timeout <= 0:
-            raise ValueError(_strings.DRIVER_TIMEOUT)
-        self.__page.set_default_timeout(timeout * 1000)
+        # (requested URL, landed URL) of a ticket page that has not been modified yet.
+        self.__loaded: Optional[tuple[str, str]] = None
+
+        # Symbol to (monotonic time, quote) of recent quotes.
+        self.__quotes: dict[str, tuple[float, Quote]] = {}
+
+        # Locators are lazy, so they can be created once and reused across navigations.
+        # first keeps the non-strict matching of the page methods they replace.
+        def first(selector):
+            return self.__page.locator(selector).first
+
+        self.__locators = SimpleNamespace(
+            download=first("button[title='Download']"),
+            symbol=first("#eq-ticket-dest-symbol"),
+            buy_symbol=self.__page.locator("text=Fund to Buy"),
+            detail=self.__page.locator(".detail-value"),
+            buy_detail=self.__page.locator(
+                "#mf-ticket__second-quote-box .detail-value"
+            ),
+            actions={
+                Action.BUY: first("text=Buy"),
+                Action.SELL: first("text=Sell"),
+            },
+            mutual_fund_action=first("text=Action"),
+            units={
+                Unit.SHARES: first("label:has-text('Shares')"),
+                Unit.DOLLARS: first("text=Dollars"),
+            },
+            quantity=first("#eqt-shared-quantity"),
+            mutual_fund_quantity=first("#mf-shared-quantity"),
+            market=first("label:has-text('Market')"),
+            limit=first("text=Limit"),
+            limit_price=first("text=Limit Price"),
+            gtc=first("text=GTC"),
+            preview_order=first("#previewOrderBtn"),
+            place_order=first("#placeOrderBtn"),
+        )
+
+    @classmethod
+    def launch(
+        cls,
+        browser_type: BrowserType,
+        user_data_dir: Union[str, Path],
+        timeout: int = 10,
+        headless: bool = True,
+        *,
+        confirm: Callable[[str], bool] = _confirm,
+        wait_until: str = "domcontentloaded",
+        block_resources: bool = False,
+    ) -> "Driver":
+        """Launch a browser with a persistent context and return a driver for it.
+
+        Cookies and local storage are kept in ``user_data_dir``, so later runs skip
+        the device verification and remembered-username steps of logging in.  The
+        browser is closed on exit.
+
+        Args:
+            browser_type: The Playwright BrowserType_ to launch.
+            user_data_dir: The directory for the browser profile.
+            timeout: The time in seconds to wait for web elements to appear.
+            headless: Whether to run the browser in headless mode.
+            confirm: Called with a prompt before and after placing an order.
+            wait_until: When a navigation is finished.
+            block_resources: Whether to abort heavy requests while navigating.
+
+        .. _browsertype: https://playwright.dev/python/docs/api/class-browsertype
+        """
+        _validate_timeout(timeout)
+
+        args = []
+        if browser_type.name == "chromium":
+            args.append("--disable-blink-features=AutomationControlled")
+        context = browser_type.launch_persistent_context(
+            user_data_dir, headless=headless, no_viewport=True, args=args
+        )
+        try:
+            # Reuse the blank tab the browser opens instead of leaving it behind.
+            page = context.pages[0] if context.pages else None
+            driver = cls.__new__(cls)
+            driver.__setup(
+                context,
+                None,
+                True,
+                timeout,
+                confirm,
+                wait_until,
+                block_resources,
+                page,
+            )
+            return driver
+        except Exception:
+            context.close()
+            raise
 
     def __enter__(self):
         """Navigate to the login page."""
-        self.__page.goto(_strings.LOGIN_URL)
+        self.__goto(_strings.LOGIN_URL)
         return self
 
     def __exit__(self, *args) -> None:
-        """Log out and close the web browser."""
-        self.__page.goto(_strings.LOGOUT_URL)
-        self.__page.close()
-        self.__context.close()
-        self.__browser.close()
+        """Log out and return the browser context to the pool.
+
+        A driver from :meth:`launch` closes its browser instead.
+
+        Raises:
+            Exception: If logging out fails.  The session cookies are cleared first.
+        """
+        try:
+            self.__page.goto(
+                _strings.LOGOUT_URL,
+                wait_until="domcontentloaded",
+                timeout=_LOGOUT_TIMEOUT,
+            )
+        except Exception:
+            self.__logger.exception("logout failed")
+            # Pooled contexts are cleared on release.  Others outlive the driver, so do
+            # not leave an authenticated session in them.
+            if self.__pool_browser is None:
+                self.__context.clear_cookies()
+            raise
+        finally:
+            self.__page.close()
+            if self.__pool_browser is not None:
+                _pool.release(self.__pool_browser, self.__context)
+            elif self.__persistent:
+                self.__context.close()
+
+    @staticmethod
+    def close_pool() -> None:
+        """Close the browser contexts kept open for reuse by later drivers."""
+        _pool.close()
 
     def fill(self, inputId: str, inputText: str) -> None:
         """Fills the specified inputId textbox with inputText on the current page"""
+        self.__forget_page()
         self.__page.fill(inputId, inputText)
 
     def goto(self, url: str) -> None:
         """go to a specific url"""
-        self.__page.goto(url)
+        self.__forget_page()
+        self.__goto(url)
 
     def click(self, elemId: str) -> None:
+        self.__forget_page()
         self.__page.click(elemId)
 
     def cash_available_to_trade(self, account: str) -> Decimal:
@@ -167,7 +554,7 @@ class Driver:
             Exception: If the cash available to trade cannot be found.
         """
         try:
-            self.__stock_set_account(account)
+            self.__stock_load_account(account)
             return _decimal(self.__inner_text(".funds-cash"))
         except Exception:
             self.__logger.exception("cash available to trade cannot be found")
@@ -176,43 +563,79 @@ class Driver:
     def quote(self, symbol: str) -> Quote:
         """Return the quote for a stock or ETF.
 
+        A quote fetched in the last 0.25 seconds is reused.
+
         Args:
             symbol: The stock or ETF symbol.
 
         Raises:
             Exception: If the quote information cannot be found.
         """
+        quote = self.__cached_quote(symbol)
+        if quote is not None:
+            return quote
+
         try:
-            self.__page.goto(_strings.TRADE_STOCK_URL)
+            self.__stock_open_ticket()
             self.__stock_set_symbol(symbol)
 
-            name = self.__inner_text(".company-title")
-            last_price = _decimal(self.__inner_text(".last-price"))
-
-            changes = self.__inner_texts(".eq-ticket__symbol__dollar_percent_chg_font")
-            dollar_change = _decimal(changes[0])
-            percent_change = _decimal(changes[1])
-
-            elements = self.__inner_texts(".block-price-layout")
-            parts = elements[0].split("x")
-            bid, bid_size = _decimal(parts[0]), _int(parts[1])
-            parts = elements[1].split("x")
-            ask, ask_size = _decimal(parts[0]), _int(parts[1])
-
-            volume = _int(self.__inner_text(".block-volume"))
-
-            return Quote(
-                symbol,
-                name,
-                last_price,
-                dollar_change,
-                percent_change,
-                bid,
-                bid_size,
-                ask,
-                ask_size,
-                volume,
-            )
+            return self.__cache_quote(_quote(symbol, _read_quote(self.__page)))
+        except Exception:
+            self.__logger.exception("quote information cannot be found")
+            raise
+
+    # Type hint requires Python 3.9+.
+    def quotes(self, symbols: list[str]) -> list[Quote]:
+        """Return the quotes for several stocks or ETFs.
+
+        Each symbol is looked up on its own page, and both the trade ticket loads and
+        the symbol lookups run in parallel.  At most 8 extra pages (tabs, when the
+        browser is not headless) are open at once.  Quotes fetched in the last 0.25
+        seconds are reused.
+
+        Args:
+            symbols: The stock or ETF symbols.
+
+        Raises:
+            Exception: If any quote information cannot be found.
+        """
+        quotes = {}
+        for symbol in symbols:
+            quote = self.__cached_quote(symbol)
+            if quote is not None:
+                quotes[symbol] = quote
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in quotes]
+
+        if len(missing) < 2:
+            for symbol in missing:
+                quotes[symbol] = self.quote(symbol)
+            return [quotes[symbol] for symbol in symbols]
+
+        try:
+            for start in range(0, len(missing), _MAX_QUOTE_PAGES):
+                batch = missing[start : start + _MAX_QUOTE_PAGES]
+                pages = [self.__new_page() for _ in batch]
+                try:
+                    # page.goto blocks until the load finishes, so start every
+                    # navigation first and then wait for each one.  The pages are
+                    # closed below, so any route stays installed until then.
+                    for page in pages:
+                        if self.__block_resources:
+                            page.route("**/*", _route)
+                        page.evaluate(_NAVIGATE_SCRIPT, _strings.TRADE_STOCK_URL)
+                    for page in pages:
+                        page.wait_for_url(_not_blank, wait_until=self.__wait_until)
+                    for page, symbol in zip(pages, batch):
+                        self.__set_symbol(
+                            page.locator("#eq-ticket-dest-symbol").first, symbol
+                        )
+                    for page, symbol in zip(pages, batch):
+                        quote = _quote(symbol, _read_quote(page))
+                        quotes[symbol] = self.__cache_quote(quote)
+                finally:
+                    for page in pages:
+                        page.close()
+            return [quotes[symbol] for symbol in symbols]
         except Exception:
             self.__logger.exception("quote information cannot be found")
             raise
@@ -227,13 +650,25 @@ class Driver:
             Exception: If the file cannot be downloaded.
         """
         try:
-            self.__page.goto(_strings.POSITIONS_URL)
-            with self.__page.expect_download() as info:
-                self.__page.click("button[title='Download']")
-            path = info.value.path()
-            if not path:
-                raise Exception
-            return path
+            return self.__download_positions()[1]
+        except Exception:
+            self.__logger.exception("file cannot be downloaded")
+            raise
+
+    def positions_stream(self) -> BytesIO:
+        """Download the portfolio positions .csv file into memory.
+
+        Returns:
+            The file contents.  The temporary file is deleted.
+
+        Raises:
+            Exception: If the file cannot be downloaded.
+        """
+        try:
+            download, path = self.__download_positions()
+            stream = BytesIO(Path(path).read_bytes())
+            download.delete()
+            return stream
         except Exception:
             self.__logger.exception("file cannot be downloaded")
             raise
@@ -467,98 +902,149 @@ class Driver:
             self.__logger.exception("mutual fund exchange order failed")
             return False
 
+    def __download_positions(self) -> tuple[Download, Path]:
+        self.__goto(_strings.POSITIONS_URL)
+        with self.__page.expect_download() as info:
+            self.__locators.download.click()
+        path = info.value.path()
+        if not path:
+            raise Exception
+        return info.value, path
+
+    def __new_page(self) -> Page:
+        page = self.__context.new_page()
+        page.set_default_timeout(self.__timeout)
+        return page
+
+    def __goto(self, url: str) -> None:
+        _goto(self.__page, url, self.__wait_until, self.__block_resources)
+
+    def __navigate(self, url: str) -> None:
+        # Skip the page load if the page is still the untouched result of the same URL.
+        if self.__loaded == (url, self.__page.url):
+            return
+        self.__load(url)
+
+    def __load(self, url: str) -> None:
+        # Always load, but let the next navigation to the same URL reuse the page.
+        self.__goto(url)
+        self.__loaded = (url, self.__page.url)
+
+    def __forget_page(self) -> None:
+        self.__loaded = None
+
     def __inner_text(self, selector: str) -> str:
         return self.__page.inner_text(selector).strip()
 
-    # Type hint requires Python 3.9+.
-    def __inner_texts(self, selector: str) -> list[str]:
-        return [
-            text.strip() for text in self.__page.locator(selector).all_inner_texts()
-        ]
-
     def __stock_set_account(self, account: str) -> None:
-        self.__page.goto(f"{_strings.TRADE_STOCK_URL}?ACCOUNT={account}")
+        self.__navigate(f"{_strings.TRADE_STOCK_URL}?ACCOUNT={account}")
+
+    def __stock_load_account(self, account: str) -> None:
+        # Reads need fresh values, so only the navigation after a read is skipped.
+        self.__load(f"{_strings.TRADE_STOCK_URL}?ACCOUNT={account}")
+
+    def __stock_open_ticket(self) -> None:
+        # Quotes do not depend on the account, so any unmodified stock ticket will do.
+        if (
+            self.__loaded is not None
+            and self.__loaded[0].startswith(_strings.TRADE_STOCK_URL)
+            and self.__loaded[1] == self.__page.url
+        ):
+            return
+        self.__navigate(_strings.TRADE_STOCK_URL)
 
     def __mutual_fund_set_account(self, account: str) -> None:
-        self.__page.goto(f"{_strings.TRADE_MUTUAL_FUND_URL}?ACCOUNT={account}")
+        self.__navigate(f"{_strings.TRADE_MUTUAL_FUND_URL}?ACCOUNT={account}")
 
-    def __set_symbol(self, selector: str, symbol: str) -> None:
-        symbol_input = self.__page.locator(selector)
-        print('SELECTOR')
-        print(selector)
+    def __set_symbol(self, symbol_input: Locator, symbol: str) -> None:
         symbol_input.fill(symbol)
         symbol_input.press("Enter")
 
     def __stock_set_symbol(self, symbol: str) -> None:
-        self.__page.fill("#eq-ticket-dest-symbol", symbol)
-        self.__page.press("#eq-ticket-dest-symbol", "Enter")
-        #self.__set_symbol("text=Symbol", symbol)
+        # Entering a symbol changes the ticket, so the next operation must reload it.
+        self.__forget_page()
+        self.__set_symbol(self.__locators.symbol, symbol)
 
     def __mutual_fund_set_symbol(self, symbol: str) -> None:
         self.__stock_set_symbol(symbol)
 
     def __mutual_fund_set_buy_symbol(self, symbol: str) -> None:
-        self.__set_symbol("text=Fund to Buy", symbol)
+        self.__set_symbol(self.__locators.buy_symbol, symbol)
 
     def __mutual_fund_wait_for_symbol(self) -> None:
-        self.__page.locator(".detail-value").wait_for()
+        self.__locators.detail.wait_for()
 
     def __mutual_fund_wait_for_buy_symbol(self) -> None:
-        self.__page.locator("#mf-ticket__second-quote-box .detail-value").wait_for()
+        self.__locators.buy_detail.wait_for()
 
     def __stock_set_action(self, action: Action) -> None:
-        if action == Action.BUY:
-            self.__page.click("text=Buy")
-        elif action == Action.SELL:
-            self.__page.click("text=Sell")
+        self.__locators.actions[action].click()
 
     def __mutual_fund_set_action(self, action: str) -> None:
-        self.__page.click("text=Action")
+        self.__locators.mutual_fund_action.click()
         self.__page.click(f"text={action}")
 
     def __stock_set_unit(self, unit: Unit) -> None:
-        if unit == Unit.SHARES:
-            self.__page.click("label:has-text('Shares')")
-        elif unit == Unit.DOLLARS:
-            self.__page.click("text=Dollars")
+        self.__locators.units[unit].click()
 
     def __mutual_fund_set_unit(self, unit: Unit) -> None:
         self.__stock_set_unit(unit)
 
     def __stock_set_quantity(self, quantity: str) -> None:
-        self.__page.fill("#eqt-shared-quantity", quantity)
+        self.__locators.quantity.fill(quantity)
 
     def __mutual_fund_set_quantity(self, quantity: str) -> None:
-        self.__page.fill("#mf-shared-quantity", quantity)
+        self.__locators.mutual_fund_quantity.fill(quantity)
 
     def __stock_set_market(self) -> None:
-        self.__page.click("label:has-text('Market')")
+        self.__locators.market.click()
 
     def __stock_set_limit(self, limit: str) -> None:
-        self.__page.click("text=Limit")
-        self.__page.fill("text=Limit Price", limit)
+        self.__locators.limit.click()
+        self.__locators.limit_price.fill(limit)
 
     def __stock_set_gtc(self) -> None:
-        self.__page.click("text=GTC")
+        self.__locators.gtc.click()
+
+    def __cached_quote(self, symbol: str) -> Optional[Quote]:
+        cached = self.__quotes.get(symbol)
+        if cached and monotonic() - cached[0] < _QUOTE_TTL:
+            return cached[1]
+        return None
+
+    def __cache_quote(self, quote: Quote) -> Quote:
+        now = monotonic()
+        # Drop expired entries so polling many symbols does not grow the cache.
+        expired = [
+            symbol
+            for symbol, (time, _) in self.__quotes.items()
+            if now - time >= _QUOTE_TTL
+        ]
+        for symbol in expired:
+            del self.__quotes[symbol]
+        self.__quotes[quote.symbol] = (now, quote)
+        return quote
 
     def __stock_bid_ask(self) -> tuple[int, ...]:
-        bid_ask = tuple(_cents(number) for number in self.__inner_texts(".number"))
+        numbers = self.__page.wait_for_function(_BID_ASK_SCRIPT).json_value()
+        bid_ask = tuple(_cents(number) for number in numbers)
         if len(bid_ask) != 2:
             raise RuntimeError("failed to get bid ask")
         return bid_ask
 
     def __click_preview_order(self) -> None:
-        self.__page.click("#previewOrderBtn")
+        self.__locators.preview_order.click()
 
     def __click_place_order(self) -> None:
-        self.__page.click("#placeOrderBtn")
+        self.__locators.place_order.click()
 
     def __place_order(self) -> bool:
         self.__click_preview_order()
 
-        if not _confirm("Place order"):
+        if not self.__confirm("Place order"):
             return False
 
         self.__click_place_order()
+        self.__quotes.clear()
 
-        return _confirm("Success")
+        return self.__confirm("Success")
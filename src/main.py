@@ -1,20 +1,34 @@
 from fidelipy import Action, Driver, Unit
 from playwright.sync_api import sync_playwright
+from os import path
 from time import sleep
 
+# Script path -> (modified time, compiled code), so repeated runs skip parsing.
+compiledScripts = {}
+
+def loadScript(scriptName):
+  scriptPath = f"./scripts/{scriptName}"
+  modifiedTime = path.getmtime(scriptPath)
+  cached = compiledScripts.get(scriptPath)
+  if cached is None or cached[0] != modifiedTime:
+    with open(scriptPath, "r") as scriptFile:
+      cached = (modifiedTime, compile(scriptFile.read(), scriptPath, "exec"))
+    compiledScripts[scriptPath] = cached
+  return cached[1]
+
 with sync_playwright() as playwright:
   browser = playwright.firefox.launch(headless=False)
   with Driver(browser) as driver:
     userInput = input("Enter 'stop' to quit or enter the script name to execute a script: ")
     while userInput != "stop":
-      script = ""
+      script = None
       try:
-        with open(f"./scripts/{userInput}", "r") as scriptFile:
-          script = scriptFile.read()
+        script = loadScript(userInput)
       except Exception as error:
         print(f"Failed to load script {userInput}: {error}")
-      try:
-        exec(script, {"driver":driver, "sleep":sleep})
-      except Exception as error:
-        print(f"Exception occurred while running script: {error}")
+      if script is not None:
+        try:
+          exec(script, {"driver":driver, "sleep":sleep})
+        except Exception as error:
+          print(f"Exception occurred while running script: {error}")
       userInput = input("Enter 'stop' to quit or enter the script name to execute a script: ")
\ No newline at end of file